@@ -0,0 +1,13 @@
+from django.apps import AppConfig
+from django.db.models import CharField, TextField
+
+
+class ApisOntologyConfig(AppConfig):
+    name = "apis_ontology"
+
+    def ready(self):
+        from . import signals  # noqa: F401
+        from .lookups import ImmutableUnaccent
+
+        CharField.register_lookup(ImmutableUnaccent)
+        TextField.register_lookup(ImmutableUnaccent)
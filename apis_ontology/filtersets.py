@@ -14,7 +14,9 @@ from apis_ontology.models import AuthorOf, Person, Work
 
 def generic_search_filter(queryset, name, value, fields=None):
     """
-    A generic filter that searches across specified fields using unaccent__icontains with OR logic.
+    A generic filter that searches across specified fields using
+    immutable_unaccent__icontains with OR logic, so the trigram indexes
+    created from `_default_search_fields` can be used by the planner.
 
     Priority for fields selection:
     1. Explicitly provided fields parameter
@@ -50,7 +52,7 @@ def generic_search_filter(queryset, name, value, fields=None):
     # Build Q objects for each field with OR logic
     q_objects = Q()
     for field in fields:
-        q_objects |= Q(**{f"{field}__unaccent__icontains": value})
+        q_objects |= Q(**{f"{field}__immutable_unaccent__icontains": value})
 
     return queryset.filter(q_objects)
 
@@ -0,0 +1,13 @@
+from django.db.models import Transform
+
+
+class ImmutableUnaccent(Transform):
+    """
+    Like `django.contrib.postgres.lookups.Unaccent`, but calls the
+    `immutable_unaccent` SQL wrapper created in migration 0028, so
+    expressions using it can be indexed (see `trigram_search_indexes`).
+    """
+
+    bilateral = True
+    lookup_name = "immutable_unaccent"
+    function = "immutable_unaccent"
@@ -0,0 +1,33 @@
+"""
+Management command to rebuild the full-text search documents
+of all Nomansland entities in bulk.
+"""
+
+from django.core.management.base import BaseCommand
+from tqdm import tqdm
+
+from apis_ontology.search_utils import (
+    get_search_entity_classes,
+    rebuild_search_documents,
+)
+
+
+class Command(BaseCommand):
+    help = "Rebuild the full-text search index of all entities"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=2000,
+            help="Number of search documents written per query.",
+        )
+
+    def handle(self, *args, **options):
+        total = 0
+        for model in tqdm(get_search_entity_classes()):
+            count = rebuild_search_documents(model, options["batch_size"])
+            self.stdout.write(f"{model.__name__}: {count} search documents")
+            total += count
+
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt {total} search documents."))
@@ -0,0 +1,223 @@
+# Generated by Django 5.2.18 on 2026-10-18 08:16
+
+import apis_ontology.lookups
+import django.contrib.postgres.indexes
+import django.db.models.functions.text
+from django.contrib.postgres.operations import TrigramExtension, UnaccentExtension
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("apis_metainfo", "0017_delete_uri"),
+        ("apis_ontology", "0027_searchdocument"),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        UnaccentExtension(),
+        # unaccent() is only STABLE because its dictionary can be changed,
+        # pinning the dictionary makes it usable in index expressions
+        migrations.RunSQL(
+            sql="""
+            CREATE OR REPLACE FUNCTION immutable_unaccent(text)
+            RETURNS text
+            LANGUAGE sql IMMUTABLE PARALLEL SAFE STRICT
+            AS $$ SELECT public.unaccent('public.unaccent'::regdictionary, $1) $$;
+            """,
+            reverse_sql="DROP FUNCTION IF EXISTS immutable_unaccent(text);",
+        ),
+        migrations.AddIndex(
+            model_name="event",
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.indexes.OpClass(
+                    django.db.models.functions.text.Upper(
+                        apis_ontology.lookups.ImmutableUnaccent("name")
+                    ),
+                    name="gin_trgm_ops",
+                ),
+                name="event_name_trgm",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="expression",
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.indexes.OpClass(
+                    django.db.models.functions.text.Upper(
+                        apis_ontology.lookups.ImmutableUnaccent("title")
+                    ),
+                    name="gin_trgm_ops",
+                ),
+                name="expression_title_trgm",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="institution",
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.indexes.OpClass(
+                    django.db.models.functions.text.Upper(
+                        apis_ontology.lookups.ImmutableUnaccent("name")
+                    ),
+                    name="gin_trgm_ops",
+                ),
+                name="institution_name_trgm",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="institution",
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.indexes.OpClass(
+                    django.db.models.functions.text.Upper(
+                        apis_ontology.lookups.ImmutableUnaccent("alternative_names")
+                    ),
+                    name="gin_trgm_ops",
+                ),
+                name="institution_alternative_n_trgm",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="manuscript",
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.indexes.OpClass(
+                    django.db.models.functions.text.Upper(
+                        apis_ontology.lookups.ImmutableUnaccent("name")
+                    ),
+                    name="gin_trgm_ops",
+                ),
+                name="manuscript_name_trgm",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="manuscript",
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.indexes.OpClass(
+                    django.db.models.functions.text.Upper(
+                        apis_ontology.lookups.ImmutableUnaccent("identifier")
+                    ),
+                    name="gin_trgm_ops",
+                ),
+                name="manuscript_identifier_trgm",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="manuscript",
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.indexes.OpClass(
+                    django.db.models.functions.text.Upper(
+                        apis_ontology.lookups.ImmutableUnaccent("description")
+                    ),
+                    name="gin_trgm_ops",
+                ),
+                name="manuscript_description_trgm",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="manuscript",
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.indexes.OpClass(
+                    django.db.models.functions.text.Upper(
+                        apis_ontology.lookups.ImmutableUnaccent("notes")
+                    ),
+                    name="gin_trgm_ops",
+                ),
+                name="manuscript_notes_trgm",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="manuscript",
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.indexes.OpClass(
+                    django.db.models.functions.text.Upper(
+                        apis_ontology.lookups.ImmutableUnaccent("additions")
+                    ),
+                    name="gin_trgm_ops",
+                ),
+                name="manuscript_additions_trgm",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="manuscriptpart",
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.indexes.OpClass(
+                    django.db.models.functions.text.Upper(
+                        apis_ontology.lookups.ImmutableUnaccent("name")
+                    ),
+                    name="gin_trgm_ops",
+                ),
+                name="manuscriptpart_name_trgm",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="manuscriptpart",
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.indexes.OpClass(
+                    django.db.models.functions.text.Upper(
+                        apis_ontology.lookups.ImmutableUnaccent("identifier")
+                    ),
+                    name="gin_trgm_ops",
+                ),
+                name="manuscriptpart_identifier_trgm",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="person",
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.indexes.OpClass(
+                    django.db.models.functions.text.Upper(
+                        apis_ontology.lookups.ImmutableUnaccent("forename")
+                    ),
+                    name="gin_trgm_ops",
+                ),
+                name="person_forename_trgm",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="person",
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.indexes.OpClass(
+                    django.db.models.functions.text.Upper(
+                        apis_ontology.lookups.ImmutableUnaccent("surname")
+                    ),
+                    name="gin_trgm_ops",
+                ),
+                name="person_surname_trgm",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="place",
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.indexes.OpClass(
+                    django.db.models.functions.text.Upper(
+                        apis_ontology.lookups.ImmutableUnaccent("label")
+                    ),
+                    name="gin_trgm_ops",
+                ),
+                name="place_label_trgm",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="place",
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.indexes.OpClass(
+                    django.db.models.functions.text.Upper(
+                        apis_ontology.lookups.ImmutableUnaccent("alternative_names")
+                    ),
+                    name="gin_trgm_ops",
+                ),
+                name="place_alternative_names_trgm",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="work",
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.indexes.OpClass(
+                    django.db.models.functions.text.Upper(
+                        apis_ontology.lookups.ImmutableUnaccent("name")
+                    ),
+                    name="gin_trgm_ops",
+                ),
+                name="work_name_trgm",
+            ),
+        ),
+    ]
@@ -2,17 +2,22 @@ import logging
 
 from apis_core.apis_entities.abc import E21_Person, E53_Place
 from apis_core.apis_entities.models import AbstractEntity
+from apis_core.apis_metainfo.models import RootObject
 from apis_core.collections.models import SkosCollection, SkosCollectionContentObject
 from apis_core.generic.abc import GenericModel
 from apis_core.history.models import VersionMixin
 from apis_core.relations.models import Relation
 from django.contrib.contenttypes.models import ContentType
+from django.contrib.postgres.indexes import GinIndex, OpClass
+from django.contrib.postgres.search import SearchVectorField
 from django.db import models
+from django.db.models.functions import Upper
 from django.urls import reverse
 from django.utils.translation import gettext_lazy as _
 from django_interval.fields import FuzzyDateParserField
 
 from .date_utils import nomansland_dateparser
+from .lookups import ImmutableUnaccent
 
 logger = logging.getLogger(__name__)
 
@@ -59,6 +64,21 @@ class NomanslandMixin(models.Model):
         return uri
 
 
+def trigram_search_indexes(model):
+    """
+    GIN trigram indexes over `UPPER(immutable_unaccent(field))` for each of
+    the model's `_default_search_fields`, matching the SQL generated by the
+    `immutable_unaccent__icontains` lookup of `generic_search_filter`.
+    """
+    return [
+        GinIndex(
+            OpClass(Upper(ImmutableUnaccent(field)), name="gin_trgm_ops"),
+            name=f"{model._meta.model_name}_{field}"[:25] + "_trgm",
+        )
+        for field in model._default_search_fields
+    ]
+
+
 class PrincipalRole(GenericModel, models.Model):
     name = models.CharField(max_length=255, unique=True)
 
@@ -395,6 +415,48 @@ class ManuscriptPart(
         ordering = ["pk"]
 
 
+for entity in [
+    Event,
+    Expression,
+    Institution,
+    Manuscript,
+    ManuscriptPart,
+    Person,
+    Place,
+    Work,
+]:
+    entity._meta.indexes.extend(trigram_search_indexes(entity))
+    # the migration autodetector only looks at indexes declared in `Meta`
+    entity._meta.original_attrs["indexes"] = entity._meta.indexes
+
+
+class SearchDocument(models.Model):
+    """
+    Precomputed full-text search document of a `NomanslandMixin` entity.
+    Kept current by the `post_save` signal in `apis_ontology.signals`,
+    removed together with the entity via the cascading `RootObject` link.
+    """
+
+    object = models.OneToOneField(
+        RootObject,
+        primary_key=True,
+        on_delete=models.CASCADE,
+        related_name="search_document",
+    )
+    content_type = models.ForeignKey(ContentType, on_delete=models.CASCADE)
+    permission = models.CharField(max_length=255)
+    search_vector = SearchVectorField(null=True)
+
+    class Meta:
+        indexes = [
+            GinIndex(fields=["search_vector"], name="searchdocument_vector_gin"),
+            models.Index(fields=["permission"], name="searchdocument_perm_idx"),
+        ]
+
+    def __str__(self):
+        return f"search document of {self.object_id}"
+
+
 class NomanslandRelationMixin(
     VersionMixin,
     Relation,
@@ -1,56 +1,100 @@
+from itertools import batched
+
 from apis_core.apis_entities.utils import get_entity_classes
 from apis_core.apis_metainfo.models import RootObject
 from apis_core.generic.helpers import default_search_fields
+from django.contrib.contenttypes.models import ContentType
 from django.contrib.postgres.search import (
     SearchQuery,
     SearchRank,
     SearchVector,
 )
-from django.db.models import CharField, F, Model, OuterRef, Q, QuerySet, Value
-from django.db.models.functions import Concat
+from django.db.models import F, Model, TextField, Value
+
+from apis_ontology.models import NomanslandMixin, SearchDocument
 
 
-def annotate_qs(qs: QuerySet, model: type[Model], fields: list[str]) -> QuerySet:
-    field_exprs = [item for field in fields for item in [F(field.name), Value(" ")]][
-        :-1
+def get_search_entity_classes() -> list[type[Model]]:
+    return [
+        entity for entity in get_entity_classes() if issubclass(entity, NomanslandMixin)
     ]
-    m = model.objects.filter(pk=OuterRef("pk")).annotate(
-        search_obj=Concat(*field_exprs, output_field=CharField())
-        if len(field_exprs) > 1
-        else F(fields[0].name)
+
+
+def _search_text(values) -> str:
+    return " ".join(str(value) for value in values if value)
+
+
+def _search_vector(text: str) -> SearchVector:
+    return SearchVector(Value(text, output_field=TextField()))
+
+
+def update_search_document(instance: Model) -> SearchDocument:
+    """
+    Create or update the `SearchDocument` of a single entity instance
+    """
+    model = instance.__class__
+    fields = default_search_fields(model)
+    text = _search_text(getattr(instance, field.name) for field in fields)
+    document, _ = SearchDocument.objects.update_or_create(
+        object_id=instance.pk,
+        defaults={
+            "content_type": ContentType.objects.get_for_model(model),
+            "permission": model.get_view_permission(),
+            "search_vector": _search_vector(text),
+        },
     )
-    annotation = {
-        f"gs_{model.__name__.lower()}": m.values_list("search_obj", flat=True)
-    }
-    qs = qs.annotate(**annotation)
-    return qs
+    return document
+
+
+def rebuild_search_documents(model: type[Model], batch_size: int = 2000) -> int:
+    """
+    Recreate the `SearchDocument`s of all instances of `model` in batches,
+    returns the number of documents written.
+    """
+    fields = [field.name for field in default_search_fields(model)]
+    content_type = ContentType.objects.get_for_model(model)
+    permission = model.get_view_permission()
+    rows = model._base_manager.order_by("pk").values_list("pk", *fields)
+    count = 0
+    for batch in batched(rows.iterator(chunk_size=batch_size), batch_size):
+        SearchDocument.objects.bulk_create(
+            [
+                SearchDocument(
+                    object_id=pk,
+                    content_type=content_type,
+                    permission=permission,
+                    search_vector=_search_vector(_search_text(values)),
+                )
+                for pk, *values in batch
+            ],
+            update_conflicts=True,
+            unique_fields=["object"],
+            update_fields=["content_type", "permission", "search_vector"],
+        )
+        count += len(batch)
+    SearchDocument.objects.filter(content_type=content_type).exclude(
+        object_id__in=model._base_manager.values("pk")
+    ).delete()
+    return count
 
 
 def search(query: str, user: object):
-    # search in entities:
-    entities = get_entity_classes()
+    permissions = [
+        entity.get_view_permission()
+        for entity in get_search_entity_classes()
+        if user.has_perm(entity.get_view_permission())
+    ]
     qs = RootObject.objects_inheritance.all()
-    entities_search_vector = []
-    for entity in entities:
-        if user.has_perm(entity.get_view_permission()):
-            qs = annotate_qs(qs, entity, default_search_fields(entity))
-            entities_search_vector.append(entity)
-    if not entities_search_vector:
+    if not permissions:
         return qs.none()
-    search_vector = SearchVector(
-        *[
-            f"gs_{entity.__name__.lower()}"
-            for entity in entities
-            if entity in entities_search_vector
-        ]
-    )
-    qs = qs.annotate(
-        search_vector=search_vector,
-        rank=SearchRank(search_vector, query),
-    )
     search_query = SearchQuery(
         query,
         search_type="websearch",
     )
-    res = qs.filter(search_vector=search_query).order_by("-rank")
-    return res.select_subclasses()
+    qs = qs.filter(
+        search_document__permission__in=permissions,
+        search_document__search_vector=search_query,
+    ).annotate(
+        rank=SearchRank(F("search_document__search_vector"), search_query),
+    )
+    return qs.order_by("-rank").select_subclasses()
@@ -1,8 +1,12 @@
 import os
 from django.contrib.auth.signals import user_logged_in
+from django.db.models.signals import post_save
 from django.dispatch import receiver
 from django.contrib.auth.models import Group
 
+from apis_ontology.models import NomanslandMixin
+from apis_ontology.search_utils import update_search_document
+
 
 
 @receiver(user_logged_in)
@@ -11,3 +15,14 @@ def add_to_group(sender, user, request, **kwargs):
     g1, _ = Group.objects.get_or_create(name='editors')
     if user.username in user_list:
         g1.user_set.add(user)
+
+
+@receiver(post_save)
+def save_search_document(sender, instance, created, raw, **kwargs):
+    """
+    Keep the `SearchDocument` of a `NomanslandMixin` entity in sync with it.
+    Deleting the entity removes the document via its `RootObject` cascade.
+    """
+    if raw or not isinstance(instance, NomanslandMixin):
+        return
+    update_search_document(instance)
@@ -0,0 +1,35 @@
+from django.db import connection
+from django.test import TestCase
+
+from apis_ontology.filtersets import generic_search_filter
+from apis_ontology.models import trigram_search_indexes
+from apis_ontology.querysets import NomanslandMixinAutocompleteQueryset
+from apis_ontology.search_utils import get_search_entity_classes
+
+
+class GenericSearchFilterIndexTestCase(TestCase):
+    """
+    The tables are empty, so sequential scans are disabled to check that
+    the planner *can* answer the search from the trigram indexes.
+    """
+
+    def explain(self, queryset):
+        with connection.cursor() as cursor:
+            cursor.execute("SET LOCAL enable_seqscan = off")
+        return queryset.explain()
+
+    def assertUsesTrigramIndexes(self, model, plan):
+        for index in trigram_search_indexes(model):
+            self.assertIn(index.name, plan)
+
+    def test_list_view_search_uses_trigram_indexes(self):
+        for model in get_search_entity_classes():
+            with self.subTest(model=model.__name__):
+                queryset = generic_search_filter(model.objects.all(), "search", "Abū")
+                self.assertUsesTrigramIndexes(model, self.explain(queryset))
+
+    def test_autocomplete_uses_trigram_indexes(self):
+        for model in get_search_entity_classes():
+            with self.subTest(model=model.__name__):
+                queryset = NomanslandMixinAutocompleteQueryset(model, "Abū")
+                self.assertUsesTrigramIndexes(model, self.explain(queryset))
@@ -0,0 +1,92 @@
+"""
+Benchmark `/search` latency against the precomputed search document table.
+
+Synthetic `RootObject`/`SearchDocument` rows are created inside a transaction
+that is rolled back at the end, so this can be run against a development
+database:
+
+    DJANGO_SETTINGS_MODULE=apis_ontology.settings.server_settings \
+        python benchmarks/search_index.py --sizes 10000 100000 1000000
+"""
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+from itertools import batched
+from types import SimpleNamespace
+
+import django
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000])
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--vocabulary", type=int, default=50_000)
+    args = parser.parse_args()
+
+    django.setup()
+    from apis_core.apis_metainfo.models import RootObject
+    from django.contrib.contenttypes.models import ContentType
+    from django.db import connection, transaction
+
+    from apis_ontology.models import Person, SearchDocument
+    from apis_ontology.search_utils import _search_vector, search
+
+    rng = random.Random(42)
+    words = [f"nomad{i}" for i in range(args.vocabulary)]
+    queries = {
+        "frequent term": words[0],
+        "rare term": words[-1],
+        "two terms": f"{words[1]} {words[2]}",
+        "phrase": f'"{words[3]} {words[4]}"',
+    }
+    user = SimpleNamespace(has_perm=lambda permission: True)
+    content_type = ContentType.objects.get_for_model(Person)
+    permission = Person.get_view_permission()
+
+    with transaction.atomic():
+        created = 0
+        for size in sorted(args.sizes):
+            for batch in batched(range(size - created), 5000):
+                roots = RootObject.objects.bulk_create(RootObject() for _ in batch)
+                SearchDocument.objects.bulk_create(
+                    SearchDocument(
+                        object=root,
+                        content_type=content_type,
+                        permission=permission,
+                        search_vector=_search_vector(
+                            " ".join(
+                                # skewed distribution so some terms are frequent
+                                words[int(rng.paretovariate(1.2)) % len(words)]
+                                for _ in range(6)
+                            )
+                        ),
+                    )
+                    for root in roots
+                )
+            created = size
+            with connection.cursor() as cursor:
+                cursor.execute(f"ANALYZE {SearchDocument._meta.db_table}")
+
+            for name, query in queries.items():
+                timings = []
+                for _ in range(args.repeat):
+                    start = time.perf_counter()
+                    list(search(query, user)[:50])
+                    timings.append((time.perf_counter() - start) * 1000)
+                print(
+                    f"{size:>9} entities  {name:<14} "
+                    f"median {statistics.median(timings):8.2f} ms  "
+                    f"max {max(timings):8.2f} ms"
+                )
+        transaction.set_rollback(True)
+
+
+if __name__ == "__main__":
+    main()